@@ -1,21 +1,52 @@
 import os
 import time
 import hashlib
+import stat
+import calendar
 import threading
+import queue
+import functools
+from contextlib import contextmanager, nullcontext
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeout
 from pathlib import Path
 from datetime import datetime
 import ftplib
-import paramiko
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+import importlib.util
 import getpass
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox, Listbox, Scrollbar, Button, ttk
 import sys
+import subprocess
 import math
-from tqdm import tqdm
 import shutil
+import shelve
+import mmap
 import logging
+import signal
+import socket
+import shlex
+import atexit
+
+# Third-party packages; paramiko, tqdm and the watchdog observer are imported where
+# they're first used, so only check they're installed here
+_REQUIRED = ("paramiko", "watchdog", "tqdm")
+_INSTALL_HINT = "Missing required packages: %s\nInstall them with: pip install " + " ".join(_REQUIRED) + "\n"
+_missing = [name for name in _REQUIRED if importlib.util.find_spec(name) is None]
+if _missing:
+    sys.stdout.write(_INSTALL_HINT % ", ".join(_missing))
+    sys.exit(1)
+
+from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent
+
+try:
+    import blake3  # Optional: much faster content hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import termios  # POSIX only; used for the masked password prompt
+    import tty
+except ImportError:
+    termios = tty = None
 
 # ANSI color codes for terminal output
 class Colors:
@@ -29,13 +60,189 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-print(f"{Colors.HEADER}{Colors.BOLD}")
-print("╔══════════════════════════════════════════════════════════════╗")
-print("║                   SFTP/FTP File Sync Monitor                 ║")
-print("║                   Developed by Jacob Wilson                  ║")
-print("║                   dfirvault@gmail.com                        ║")
-print("╚══════════════════════════════════════════════════════════════╝")
-print(f"{Colors.END}")
+# Don't embed escape codes when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+sys.stdout.write(
+    f"{Colors.HEADER}{Colors.BOLD}\n"
+    "╔══════════════════════════════════════════════════════════════╗\n"
+    "║                   SFTP/FTP File Sync Monitor                 ║\n"
+    "║                   Developed by Jacob Wilson                  ║\n"
+    "║                   dfirvault@gmail.com                        ║\n"
+    "╚══════════════════════════════════════════════════════════════╝\n"
+    f"{Colors.END}\n"
+)
+sys.stdout.flush()
+
+# Colored message templates for per-file and per-tick output, built once
+NEW_FILE_MSG = f"{Colors.BLUE}New file detected: %s{Colors.END}"
+CHANGED_FILE_MSG = f"{Colors.YELLOW}File changed: %s{Colors.END}"
+DELETED_LOCAL_MSG = f"{Colors.RED}File deleted locally: %s{Colors.END}"
+DOWNLOADED_MSG = f"{Colors.GREEN}✓ Downloaded: %s{Colors.END}"
+UPLOADED_MSG = f"{Colors.GREEN}✓ Uploaded: %s{Colors.END}"
+COUNTDOWN_MSG = f"{Colors.CYAN}Next check in %ds (interval: %ss)%s{Colors.END}"
+# Start-up summaries for each monitoring direction, written in a single call
+REMOTE_START_FMT = (
+    f"\n{Colors.HEADER}{Colors.BOLD}Starting REMOTE monitoring...{Colors.END}\n"
+    f"{Colors.YELLOW}The tool will check for changes on the remote server{Colors.END}\n"
+    f"{Colors.YELLOW}Base interval: %s seconds (will check immediately after changes){Colors.END}\n"
+    f"{Colors.YELLOW}Any changes detected will be downloaded to your local folder{Colors.END}\n"
+)
+LOCAL_START_FMT = (
+    f"\n{Colors.HEADER}{Colors.BOLD}Starting LOCAL monitoring...{Colors.END}\n"
+    f"{Colors.YELLOW}The tool will watch for changes in your local folder{Colors.END}\n"
+    f"{Colors.YELLOW}Base interval: %s seconds for periodic checks{Colors.END}\n"
+    f"{Colors.YELLOW}Any changes detected will be uploaded to the remote server{Colors.END}\n"
+)
+DOWNLOADING_DESC = f"{Colors.BLUE}Downloading{Colors.END}"
+UPLOADING_DESC = f"{Colors.CYAN}Uploading{Colors.END}"
+STOPPED_BY_USER_MSG = f"\n{Colors.YELLOW}Monitoring stopped by user{Colors.END}\n".encode()
+# Interval selection menus, each written in a single call
+_INTERVAL_MENU = (
+    f"\n{Colors.HEADER}{Colors.BOLD}Monitoring Interval Selection{Colors.END}\n"
+    f"{Colors.YELLOW}Please choose a monitoring interval:{Colors.END}\n"
+    f"{Colors.CYAN}1. 1 minute (frequent checks){Colors.END}\n"
+    f"{Colors.CYAN}2. 5 minutes (balanced){Colors.END}\n"
+    f"{Colors.CYAN}3. 20 minutes (less frequent){Colors.END}\n"
+    f"{Colors.CYAN}4. 60 minutes (infrequent){Colors.END}\n"
+    f"{Colors.CYAN}5. Custom interval{Colors.END}\n"
+)
+_CUSTOM_MENU = (
+    f"\n{Colors.HEADER}Custom Interval Selection{Colors.END}\n"
+    f"{Colors.YELLOW}Choose time unit:{Colors.END}\n"
+    f"{Colors.CYAN}1. Seconds{Colors.END}\n"
+    f"{Colors.CYAN}2. Minutes{Colors.END}\n"
+    f"{Colors.CYAN}3. Hours{Colors.END}\n"
+)
+# Prompts and errors repeated by the interval selection retry loops
+_PROMPT_CHOICE_1_5 = f"\n{Colors.CYAN}Enter your choice (1-5): {Colors.END}"
+_PROMPT_CHOICE_1_3 = f"{Colors.CYAN}Enter your choice (1-3): {Colors.END}"
+_PROMPT_INTERVAL_VALUE = f"{Colors.CYAN}Enter the interval value: {Colors.END}"
+_INVALID_1_5 = f"{Colors.RED}Invalid choice. Please enter 1-5.{Colors.END}"
+_INVALID_1_3 = f"{Colors.RED}Invalid choice. Please enter 1-3.{Colors.END}"
+_INVALID_FIELD = f"{Colors.RED}Invalid %s %r: expected %s.{Colors.END}"
+
+# Protocol names and default ports, indexed by config['use_sftp']
+_PROTO = ("FTP", "SFTP")
+_DEFAULT_PORT = (21, 22)
+
+# Turns Windows-style separators from the folder picker into remote POSIX paths
+_BACKSLASH_TO_SLASH = str.maketrans('\\', '/')
+
+# Seconds for each preset interval menu choice, and per custom interval unit
+_INTERVAL_MAP = {'1': 60, '2': 300, '3': 1200, '4': 3600}
+_UNIT_MULT = {'1': 1, '2': 60, '3': 3600}
+
+def _parse_number(raw):
+    """Parse plain digits as an exact int, anything else (e.g. "1.5") as a float"""
+    return int(raw) if raw.isdigit() else float(raw)
+
+# Parser, range check and description for each free-form numeric prompt
+_RULES = {
+    'port': (int, lambda v: 1 <= v <= 65535, "an integer from 1 to 65535"),
+    'interval': (_parse_number, lambda v: 0 < v <= threading.TIMEOUT_MAX,
+                 "a number greater than 0 and at most %d" % threading.TIMEOUT_MAX),
+}
+
+# Check and description for each field of the finished config, verified in one pass.
+# Credentials aren't listed: the server has accepted them by then, and an empty FTP
+# user name is a valid anonymous login
+_CONFIG_SCHEMA = {
+    'use_sftp': (lambda v: isinstance(v, bool), "true or false"),
+    'host': (lambda v: isinstance(v, str) and bool(v), "a host name or address"),
+    'port': (lambda v: isinstance(v, int) and 1 <= v <= 65535, "an integer from 1 to 65535"),
+    'interval': (lambda v: isinstance(v, int) and 0 < v <= threading.TIMEOUT_MAX,
+                 "a whole number of seconds from 1 to %d" % threading.TIMEOUT_MAX),
+    'remote_folder': (lambda v: isinstance(v, str) and bool(v), "a remote folder"),
+    'local_folder': (lambda v: isinstance(v, str) and os.path.isdir(v), "an existing local folder"),
+    'monitor_remote': (lambda v: isinstance(v, bool), "true or false"),
+}
+
+# Parallel transfers, kept below the usual sshd MaxSessions limit of 10
+MAX_TRANSFER_WORKERS = 8
+# Worker threads (and pooled SFTP channels) for transfers; lower it, never above
+# MAX_TRANSFER_WORKERS, for servers with a smaller MaxSessions
+TRANSFER_WORKERS = MAX_TRANSFER_WORKERS
+# Seconds between liveness checks while waiting for a pooled SFTP channel to come back
+CHANNEL_WAIT = 1
+
+# Ciphers to negotiate first when both ends support them: AES-GCM runs on AES-NI/CLMUL
+# and needs no separate MAC pass (paramiko has no chacha20-poly1305)
+PREFERRED_CIPHERS = ('aes128-gcm@openssh.com', 'aes256-gcm@openssh.com')
+
+# Remote listing run over an SSH exec channel: one streamed reply instead of a READDIR
+# round-trip per ~100 entries. Fields are size, mtime, type and name, NUL-terminated
+# so any file name parses safely. -H follows the folder itself when it is a symlink
+EXEC_LIST_COMMAND = "find -H %s -mindepth 1 -maxdepth 1 -printf '%%s\\t%%T@\\t%%y\\t%%f\\0'"
+EXEC_TIMEOUT = 30
+# Consecutive exec listing failures before falling back to SFTP listings for the session
+EXEC_LIST_MAX_FAILURES = 3
+
+# Remote checksums for the initial sync, computed server-side in batches of this many files
+# (-z: NUL-terminated records, no escaping of odd file names)
+EXEC_HASH_COMMAND = "cd %s && sha256sum -z -- %s"
+EXEC_HASH_BATCH = 200
+
+# Server-side change notifications for REMOTE mode; each output line just wakes the poll loop
+EXEC_WATCH_COMMAND = "inotifywait -m -q -e close_write,moved_to,moved_from,delete --format %%e %s"
+
+# Seconds a remote folder listing is reused while browsing for the remote folder
+FOLDER_CACHE_TTL = 30
+
+# Seconds to wait for a DNS answer and for the TCP connect, so a typo'd or
+# unreachable host fails quickly instead of hanging the setup prompts
+DNS_TIMEOUT = 3
+CONNECT_TIMEOUT = 10
+
+# Seconds between SSH keepalives so idle sessions aren't dropped by NAT/firewalls
+KEEPALIVE_INTERVAL = 30
+
+# Seconds between countdown refreshes while waiting for the next remote check
+COUNTDOWN_REFRESH = 5
+
+# Minimum seconds between REMOTE checks when server change notifications keep arriving;
+# matches the quickest polling step, so notifications only ever shorten the longer waits
+WAKE_MIN_GAP = 5
+
+# Quiet period before a changed local file is uploaded, and the
+# re-check used to spot files that are still being written
+DEBOUNCE_DELAY = 0.2
+SIZE_SETTLE_DELAY = 0.05
+
+# Read size used when hashing local files
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_ALGORITHM = 'blake3' if blake3 else 'sha256'
+
+# Read size used when streaming transfers
+TRANSFER_BUFFER_SIZE = 256 * 1024
+
+# Larger SSH window/packet sizes keep more data in flight on high-latency links
+SSH_WINDOW_SIZE = 2 ** 27
+SSH_MAX_PACKET_SIZE = 2 ** 19
+
+# Outstanding SFTP read requests per downloaded file
+MAX_PREFETCH_REQUESTS = 64
+
+# Bytes per SFTP read/write request (paramiko defaults to 32 KiB); 64 KiB is the
+# largest read every OpenSSH sftp-server answers in full
+SFTP_REQUEST_SIZE = 64 * 1024
+
+# Seconds Ctrl+C teardown waits for the hash cache lock before leaving the cache open
+CACHE_CLOSE_TIMEOUT = 1
+
+# Set to keep the regular KeyboardInterrupt teardown instead of exiting at once on Ctrl+C
+NO_HARD_EXIT_ENV = 'SFTPMON_NO_HARD_EXIT'
+
+# Set to "stars" to echo a * per password character instead of the silent getpass prompt
+MASK_ENV = 'SFTPMON_MASK'
+
+# Password prompt echo, written unbuffered straight to the terminal
+_STDOUT_FD = 1
+_STAR = b'*'
+_BS = b'\b \b'
+_CRLF = b'\r\n'
 
 # Setup logging
 def setup_logging(local_folder):
@@ -55,6 +262,35 @@ def setup_logging(local_folder):
     
     return logging.getLogger(__name__)
 
+def advise_read(local_path_or_file, advice='sequential'):
+    """Hint the kernel about how we'll read a local file so disk reads overlap with our work"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    flag = os.POSIX_FADV_SEQUENTIAL if advice == 'sequential' else os.POSIX_FADV_WILLNEED
+    try:
+        if isinstance(local_path_or_file, str):
+            with open(local_path_or_file, 'rb') as f:
+                os.posix_fadvise(f.fileno(), 0, 0, flag)
+        else:
+            os.posix_fadvise(local_path_or_file.fileno(), 0, 0, flag)
+    except OSError:
+        pass
+
+def progress_bar(total, desc):
+    """Byte progress bar that redraws at most 4x per second and once per MiB"""
+    from tqdm import tqdm
+    return tqdm(total=total, unit='B', unit_scale=True, desc=desc,
+                mininterval=0.25, miniters=1024 * 1024,
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]")
+
+@functools.lru_cache(maxsize=None)
+def get_client(host, port, username, password, use_sftp=True):
+    """Return the shared client for a server so all callers reuse one live connection"""
+    return FTPClient(host, username, password, port, use_sftp)
+
+# Result of FTPClient.stat(); one round-trip answers both "exists?" and "changed?"
+Stat = namedtuple('Stat', ['exists', 'size', 'mtime'])
+
 class FTPClient:
     def __init__(self, host, username, password, port=22, use_sftp=True):
         self.host = host
@@ -63,260 +299,792 @@ class FTPClient:
         self.port = port
         self.use_sftp = use_sftp
         self.connection = None
+        # Idle SFTP channels opened over the single SSH transport
+        self._channels = queue.Queue()
+        # Bumped on every new session, including acquire()'s lazy reconnects
+        self.generation = 0
+        # SFTP channels open now (idle or borrowed), and how many we may open
+        self._open_channels = 0
+        self._max_channels = TRANSFER_WORKERS
+        # ftplib has a single control connection, so FTP access is serialized
+        self._lock = threading.RLock()
+        # Consecutive refused (or garbled) exec listings; at EXEC_LIST_MAX_FAILURES
+        # the exec listing is given up on, so a one-off error doesn't disable it
+        self._exec_failures = 0
+        # Folder listings seen while browsing: path -> (monotonic time, names)
+        self._folder_cache = {}
+        
+    def is_alive(self):
+        """Check whether the underlying connection is still usable"""
+        if not self.connection:
+            return False
+        if self.use_sftp:
+            return self.connection.is_active()
+        try:
+            with self._lock:
+                self.connection.voidcmd('NOOP')
+            return True
+        except:
+            return False
         
     def connect(self):
+        # Reuse the existing connection instead of paying for a new handshake
+        if self.is_alive():
+            return True
+        self.disconnect(quiet=True)
         try:
             if self.use_sftp:
-                self.connection = paramiko.Transport((self.host, self.port))
+                import paramiko
+                # Send small SFTP requests (stat, open, acks) immediately rather than waiting
+                # on Nagle; buffer sizes are left to the kernel's autotuning
+                sock = socket.create_connection((self.host, self.port), timeout=CONNECT_TIMEOUT)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.connection = paramiko.Transport(sock,
+                                                     default_window_size=SSH_WINDOW_SIZE,
+                                                     default_max_packet_size=SSH_MAX_PACKET_SIZE)
+                # Move the AEAD ciphers to the front, keeping the rest as fallbacks for older servers
+                opts = self.connection.get_security_options()
+                opts.ciphers = (tuple(c for c in PREFERRED_CIPHERS if c in opts.ciphers) +
+                                tuple(c for c in opts.ciphers if c not in PREFERRED_CIPHERS))
                 self.connection.connect(username=self.username, password=self.password)
-                self.sftp = paramiko.SFTPClient.from_transport(self.connection)
-                print(f"{Colors.GREEN}✓ Connected to SFTP server {self.host}:{self.port}{Colors.END}")
+                self.connection.set_keepalive(KEEPALIVE_INTERVAL)
+                self._channels.put(paramiko.SFTPClient.from_transport(self.connection))
+                with self._lock:
+                    self._open_channels += 1
             else:
                 self.connection = ftplib.FTP()
-                self.connection.connect(self.host, self.port)
+                self.connection.connect(self.host, self.port, timeout=CONNECT_TIMEOUT)
                 self.connection.login(self.username, self.password)
-                print(f"{Colors.GREEN}✓ Connected to FTP server {self.host}:{self.port}{Colors.END}")
+                # The timeout is only for reaching the server; long transfers may idle longer
+                self.connection.sock.settimeout(None)
+                self.connection.timeout = None
+            # Lets callers notice a (possibly transparent) reconnect and redo per-session setup
+            self.generation += 1
+            print(f"{Colors.GREEN}✓ Connected to {_PROTO[self.use_sftp]} server {self.host}:{self.port}{Colors.END}")
             return True
         except Exception as e:
             print(f"{Colors.RED}✗ Connection failed: {e}{Colors.END}")
+            self.connection = None
             return False
     
-    def disconnect(self):
+    def disconnect(self, quiet=False):
+        self._folder_cache.clear()
+        while not self._channels.empty():
+            try:
+                sftp = self._channels.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._open_channels -= 1
+            try:
+                sftp.close()
+            except:
+                pass
         if self.connection:
-            if self.use_sftp:
-                self.connection.close()
+            try:
+                if self.use_sftp:
+                    self.connection.close()
+                else:
+                    self.connection.quit()
+            except:
+                pass
+            self.connection = None
+            if not quiet:
+                print(f"{Colors.YELLOW}Disconnected from server{Colors.END}")
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow an SFTP channel (or the FTP connection) and return it to the pool afterwards"""
+        # Lazily re-establish a dropped session instead of failing every later transfer
+        if not self.connection or (self.use_sftp and not self.connection.is_active()):
+            with self._lock:
+                if not self.connect():
+                    raise ConnectionError("Not connected to %s:%s" % (self.host, self.port))
+
+        if not self.use_sftp:
+            with self._lock:
+                yield self.connection
+            return
+        
+        sftp = self._take_channel()
+        try:
+            yield sftp
+        finally:
+            if sftp.get_channel().closed:
+                sftp.close()
+                with self._lock:
+                    self._open_channels -= 1
             else:
-                self.connection.quit()
-            print(f"{Colors.YELLOW}Disconnected from server{Colors.END}")
+                self._channels.put(sftp)
+    
+    def _take_channel(self):
+        """Return an idle SFTP channel, opening one while under the cap, else wait for one to come back"""
+        import paramiko
+        while True:
+            try:
+                return self._channels.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                may_open = self._open_channels < self._max_channels
+                if may_open:
+                    self._open_channels += 1
+            if may_open:
+                try:
+                    # Another channel over the same transport, no new handshake needed
+                    return paramiko.SFTPClient.from_transport(self.connection)
+                except paramiko.SSHException:
+                    # Refused while the session is up: the server allows fewer channels than
+                    # we'd like (sshd MaxSessions). Concurrent refusals can surface as a bare
+                    # SSHException rather than ChannelException, so both count. Settle for
+                    # the channels already open and wait for one of those
+                    with self._lock:
+                        self._open_channels -= 1
+                        self._max_channels = max(self._open_channels, 1)
+                        if not self._open_channels or not self.is_alive():
+                            raise
+                except Exception:
+                    with self._lock:
+                        self._open_channels -= 1
+                    raise
+            try:
+                return self._channels.get(timeout=CHANNEL_WAIT)
+            except queue.Empty:
+                if not self.is_alive():
+                    raise ConnectionError("Not connected to %s:%s" % (self.host, self.port))
     
     def list_files(self, remote_path):
         try:
-            if self.use_sftp:
-                return self.sftp.listdir(remote_path)
-            else:
-                return self.connection.nlst(remote_path)
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    return conn.listdir(remote_path)
+                else:
+                    return conn.nlst(remote_path)
         except Exception as e:
             print(f"{Colors.RED}Error listing files: {e}{Colors.END}")
             return []
     
+    def exec_command(self, command):
+        """Run a shell command over its own SSH channel and return (exit_status, stdout)"""
+        channel = self.connection.open_session()
+        try:
+            channel.settimeout(EXEC_TIMEOUT)
+            channel.exec_command(command)
+            output = channel.makefile('rb').read()
+            return channel.recv_exit_status(), output
+        finally:
+            channel.close()
+    
+    def exec_list_attr(self, remote_path):
+        """List a directory with `find` over an SSH exec channel, or None if the server won't run it"""
+        try:
+            status, output = self.exec_command(EXEC_LIST_COMMAND % shlex.quote(remote_path))
+            if status != 0:
+                return None
+            
+            entries = []
+            for record in output.split(b'\0')[:-1]:
+                size, mtime, kind, name = record.split(b'\t', 3)
+                entries.append((os.fsdecode(name), int(size), int(float(mtime)), kind == b'd'))
+            return entries
+        except Exception:
+            # No shell access (e.g. internal-sftp only), no GNU find, or unexpected output
+            return None
+    
+    def remote_sha256(self, remote_dir, names):
+        """SHA-256 hex digests of remote files keyed by name, computed server-side; {} if unavailable"""
+        if not self.use_sftp or not self.is_alive():
+            return {}
+        digests = {}
+        for i in range(0, len(names), EXEC_HASH_BATCH):
+            batch = " ".join(shlex.quote(name) for name in names[i:i + EXEC_HASH_BATCH])
+            output = b''
+            try:
+                # Read as it arrives so a batch stalled on one slow file keeps what came before it
+                channel = self.connection.open_session()
+                try:
+                    channel.settimeout(EXEC_TIMEOUT)
+                    channel.exec_command(EXEC_HASH_COMMAND % (shlex.quote(remote_dir), batch))
+                    # A non-zero exit only means some files couldn't be read; keep the rest
+                    while True:
+                        data = channel.recv(32768)
+                        if not data:
+                            break
+                        output += data
+                finally:
+                    channel.close()
+            except socket.timeout:
+                pass  # Give up on the rest of this batch, not on the whole call
+            except Exception:
+                break  # No shell access or no sha256sum on the server
+            # Only complete NUL-terminated records; a timed-out batch may end mid-record
+            for record in output.split(b'\0')[:-1]:
+                digest, sep, name = record.partition(b' ')
+                if sep:
+                    digests[os.fsdecode(name[1:])] = digest.decode('ascii')  # name follows ' ' or '*'
+        return digests
+    
+    def list_attr(self, remote_path):
+        """List a directory as (name, size, mtime, is_dir) tuples in a single round-trip"""
+        if self.use_sftp and self._exec_failures < EXEC_LIST_MAX_FAILURES and self.is_alive():
+            entries = self.exec_list_attr(remote_path)
+            # An empty result is double-checked over SFTP below: find can come back
+            # silently empty where the SFTP server still sees files
+            if entries:
+                self._exec_failures = 0
+                return entries
+            if entries is None:
+                self._exec_failures += 1
+        
+        try:
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    return [(attr.filename, attr.st_size, attr.st_mtime, stat.S_ISDIR(attr.st_mode))
+                            for attr in conn.listdir_attr(remote_path)]
+                else:
+                    try:
+                        entries = []
+                        for name, facts in conn.mlsd(remote_path, facts=["size", "modify", "type"]):
+                            entry_type = facts.get('type', 'file').lower()
+                            if entry_type in ['cdir', 'pdir']:
+                                continue
+                            modify = facts.get('modify')
+                            mtime = calendar.timegm(time.strptime(modify[:14], '%Y%m%d%H%M%S')) if modify else None
+                            entries.append((name, int(facts.get('size', -1)), mtime, entry_type == 'dir'))
+                        return entries
+                    except ftplib.error_perm:
+                        # Server doesn't support MLSD, fall back to NLST + SIZE/MDTM
+                        entries = []
+                        for name in conn.nlst(remote_path):
+                            name = os.path.basename(name)
+                            item_path = os.path.join(remote_path, name).replace('\\', '/')
+                            item_stat = self.stat(item_path)
+                            entries.append((name, item_stat.size, item_stat.mtime, False))
+                        return entries
+        except Exception as e:
+            print(f"{Colors.RED}Error listing files: {e}{Colors.END}")
+            return None
+    
     def list_folders(self, remote_path="."):
+        """List subfolders, reusing a listing of the same path fetched within FOLDER_CACHE_TTL"""
+        key = remote_path.translate(_BACKSLASH_TO_SLASH)
+        cached = self._folder_cache.get(key)
+        if cached and time.monotonic() - cached[0] < FOLDER_CACHE_TTL:
+            return cached[1]
+        folders = self._fetch_folders(key)
+        # Failed listings aren't cached so the next visit retries
+        if folders is None:
+            return []
+        self._folder_cache[key] = (time.monotonic(), folders)
+        return folders
+    
+    def _fetch_folders(self, remote_path):
         try:
+            # Names and types come back with the listing, no stat per entry
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    return [attr.filename for attr in conn.listdir_attr(remote_path)
+                            if attr.filename not in ('.', '..') and stat.S_ISDIR(attr.st_mode or 0)]
+                try:
+                    return [name for name, facts in conn.mlsd(remote_path, facts=["type"])
+                            if facts.get('type', '').lower() == 'dir']
+                except ftplib.error_perm:
+                    pass  # Server doesn't support MLSD
+            
             items = self.list_files(remote_path)
             folders = []
             
             for item in items:
                 if item in ['.', '..']:
                     continue
-                    
-                try:
-                    if self.use_sftp:
-                        item_path = os.path.join(remote_path, item).replace('\\', '/')
-                        if self.sftp.stat(item_path).st_mode & 0o40000:  # Check if it's a directory
-                            folders.append(item)
-                    else:
-                        # For FTP, we'll assume it's a folder if we can't determine otherwise
-                        folders.append(item)
-                except:
-                    continue
-                    
+                # For FTP, we'll assume it's a folder if we can't determine otherwise
+                folders.append(item)
+            
             return folders
         except Exception as e:
             print(f"{Colors.RED}Error listing folders: {e}{Colors.END}")
-            return []
+            return None
     
-    def download_file(self, remote_path, local_path, logger):
+    def download_file(self, remote_path, local_path, logger, progress=None):
         try:
-            if self.use_sftp:
-                # Get file size for progress tracking
-                file_size = self.sftp.stat(remote_path).st_size
-                
-                # Show progress bar for download
-                with tqdm(total=file_size, unit='B', unit_scale=True, 
-                         desc=f"{Colors.BLUE}Downloading{Colors.END}", 
-                         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]") as pbar:
-                    def progress_callback(transferred, total):
-                        pbar.total = total
-                        pbar.update(transferred - pbar.n)
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    with conn.open(remote_path, 'rb') as rf, open(local_path, 'wb') as lf:
+                        # Get file size for progress tracking
+                        file_size = rf.stat().st_size
+                        rf.MAX_REQUEST_SIZE = SFTP_REQUEST_SIZE
+                        # Issue the read requests up front so many are in flight at once,
+                        # capped so huge files don't flood the server with requests
+                        try:
+                            rf.prefetch(file_size, max_concurrent_requests=MAX_PREFETCH_REQUESTS)
+                        except TypeError:
+                            rf.prefetch(file_size)  # paramiko < 3.3 has no request cap
+                        
+                        # Show progress bar for download
+                        with (nullcontext(progress) if progress else progress_bar(file_size, DOWNLOADING_DESC)) as pbar:
+                            for chunk in iter(lambda: rf.read(TRANSFER_BUFFER_SIZE), b""):
+                                lf.write(chunk)
+                                pbar.update(len(chunk))
+                else:
+                    # FTP download with progress
+                    file_size = conn.size(remote_path)
                     
-                    self.sftp.get(remote_path, local_path, callback=progress_callback)
-            else:
-                # FTP download with progress
-                file_size = self.connection.size(remote_path)
-                
-                with open(local_path, 'wb') as f:
-                    with tqdm(total=file_size, unit='B', unit_scale=True, 
-                             desc=f"{Colors.BLUE}Downloading{Colors.END}", 
-                             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]") as pbar:
-                        def callback(data):
-                            f.write(data)
-                            pbar.update(len(data))
-                            
-                        self.connection.retrbinary(f'RETR {remote_path}', callback)
+                    with open(local_path, 'wb') as f:
+                        with (nullcontext(progress) if progress else progress_bar(file_size, DOWNLOADING_DESC)) as pbar:
+                            def callback(data):
+                                f.write(data)
+                                pbar.update(len(data))
+                                
+                            conn.retrbinary(f'RETR {remote_path}', callback, blocksize=TRANSFER_BUFFER_SIZE)
             
             filename = os.path.basename(local_path)
-            print(f"{Colors.GREEN}✓ Downloaded: {filename}{Colors.END}")
-            logger.info(f"DOWNLOADED: {filename} from {remote_path} to {local_path}")
+            print(DOWNLOADED_MSG % filename)
+            logger.info("DOWNLOADED: %s from %s to %s", filename, remote_path, local_path)
             return True
         except Exception as e:
             filename = os.path.basename(local_path)
             print(f"{Colors.RED}✗ Download failed: {e}{Colors.END}")
-            logger.error(f"DOWNLOAD FAILED: {filename} - {e}")
+            logger.error("DOWNLOAD FAILED: %s - %s", filename, e)
             return False
     
-    def upload_file(self, local_path, remote_path, logger):
+    def upload_file(self, local_path, remote_path, logger, progress=None):
         try:
             file_size = os.path.getsize(local_path)
             
-            if self.use_sftp:
-                # SFTP upload with progress
-                with tqdm(total=file_size, unit='B', unit_scale=True, 
-                         desc=f"{Colors.CYAN}Uploading{Colors.END}", 
-                         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]") as pbar:
-                    def progress_callback(transferred, total):
-                        pbar.total = total
-                        pbar.update(transferred - pbar.n)
-                    
-                    self.sftp.put(local_path, remote_path, callback=progress_callback)
-            else:
-                # FTP upload with progress
-                with open(local_path, 'rb') as f:
-                    with tqdm(total=file_size, unit='B', unit_scale=True, 
-                             desc=f"{Colors.CYAN}Uploading{Colors.END}", 
-                             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]") as pbar:
-                        def callback(data):
-                            pbar.update(len(data))
-                            return data
-                            
-                        self.connection.storbinary(f'STOR {remote_path}', f, callback=callback)
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    # SFTP upload with progress
+                    with open(local_path, 'rb') as lf, conn.open(remote_path, 'wb') as rf:
+                        advise_read(lf)
+                        # Don't wait for each write to be acknowledged before sending the next
+                        rf.set_pipelined(True)
+                        rf.MAX_REQUEST_SIZE = SFTP_REQUEST_SIZE
+                        with (nullcontext(progress) if progress else progress_bar(file_size, UPLOADING_DESC)) as pbar:
+                            for chunk in iter(lambda: lf.read(TRANSFER_BUFFER_SIZE), b""):
+                                rf.write(chunk)
+                                pbar.update(len(chunk))
+                else:
+                    # FTP upload with progress
+                    with open(local_path, 'rb') as f:
+                        advise_read(f)
+                        with (nullcontext(progress) if progress else progress_bar(file_size, UPLOADING_DESC)) as pbar:
+                            def callback(data):
+                                pbar.update(len(data))
+                                return data
+                                
+                            conn.storbinary(f'STOR {remote_path}', f, blocksize=TRANSFER_BUFFER_SIZE, callback=callback)
             
             filename = os.path.basename(local_path)
-            print(f"{Colors.GREEN}✓ Uploaded: {filename}{Colors.END}")
-            logger.info(f"UPLOADED: {filename} from {local_path} to {remote_path}")
+            print(UPLOADED_MSG % filename)
+            logger.info("UPLOADED: %s from %s to %s", filename, local_path, remote_path)
             return True
         except Exception as e:
             filename = os.path.basename(local_path)
             print(f"{Colors.RED}✗ Upload failed: {e}{Colors.END}")
-            logger.error(f"UPLOAD FAILED: {filename} - {e}")
+            logger.error("UPLOAD FAILED: %s - %s", filename, e)
             return False
     
-    def get_file_size(self, remote_path):
+    def upload_many(self, pairs, logger, progress=None):
+        """Upload several (local_path, remote_path) files over one channel and return the uploaded local paths"""
+        uploaded = []
+        # One read buffer reused for every file in the batch
+        buf = bytearray(TRANSFER_BUFFER_SIZE)
+        view = memoryview(buf)
+        
+        done = 0
         try:
-            if self.use_sftp:
-                return self.sftp.stat(remote_path).st_size
-            else:
-                return self.connection.size(remote_path)
-        except:
-            return -1
+            with self.acquire() as conn:
+                for i, (local_path, remote_path) in enumerate(pairs):
+                    filename = os.path.basename(local_path)
+                    # Start pulling the next file into the page cache while this one is sent
+                    if i + 1 < len(pairs):
+                        advise_read(pairs[i + 1][0], 'willneed')
+                    try:
+                        with open(local_path, 'rb') as lf:
+                            advise_read(lf)
+                            if self.use_sftp:
+                                with conn.open(remote_path, 'wb') as rf:
+                                    # Don't wait for each write to be acknowledged before sending the next
+                                    rf.set_pipelined(True)
+                                    rf.MAX_REQUEST_SIZE = SFTP_REQUEST_SIZE
+                                    while True:
+                                        n = lf.readinto(buf)
+                                        if not n:
+                                            break
+                                        rf.write(view[:n])
+                                        if progress:
+                                            progress.update(n)
+                            else:
+                                def callback(data):
+                                    if progress:
+                                        progress.update(len(data))
+                            
+                                conn.storbinary(f'STOR {remote_path}', lf, blocksize=TRANSFER_BUFFER_SIZE, callback=callback)
+                    
+                        print(UPLOADED_MSG % filename)
+                        logger.info("UPLOADED: %s from %s to %s", filename, local_path, remote_path)
+                        uploaded.append(local_path)
+                    except Exception as e:
+                        print(f"{Colors.RED}✗ Upload failed: {e}{Colors.END}")
+                        logger.error("UPLOAD FAILED: %s - %s", filename, e)
+                    done = i + 1
+        except Exception as e:
+            # No channel for this batch (e.g. the server refused another session), or it
+            # broke mid-batch: report the files it never got to as failed uploads
+            for local_path, _ in pairs[done:]:
+                print(f"{Colors.RED}✗ Upload failed: {e}{Colors.END}")
+                logger.error("UPLOAD FAILED: %s - %s", os.path.basename(local_path), e)
+        
+        return uploaded
     
-    def file_exists(self, remote_path):
+    def stat(self, remote_path):
+        """Return Stat(exists, size, mtime) for a remote path"""
         try:
-            if self.use_sftp:
-                self.sftp.stat(remote_path)
-            else:
-                self.connection.size(remote_path)
-            return True
+            with self.acquire() as conn:
+                if self.use_sftp:
+                    attr = conn.stat(remote_path)
+                    return Stat(True, attr.st_size, attr.st_mtime)
+                else:
+                    size = conn.size(remote_path)
+                    try:
+                        mtime = calendar.timegm(time.strptime(conn.voidcmd(f'MDTM {remote_path}')[4:18], '%Y%m%d%H%M%S'))
+                    except (ftplib.error_perm, ValueError):
+                        mtime = 0  # Server doesn't support MDTM
+                    return Stat(True, size, mtime)
         except:
+            return Stat(False, -1, 0)
+
+def diff_states(previous, current):
+    """Compare two name -> state snapshots, returning (added, removed, modified) names"""
+    added = current.keys() - previous.keys()
+    removed = previous.keys() - current.keys()
+    modified = [name for name in current.keys() & previous.keys() if current[name] != previous[name]]
+    return added, removed, modified
+
+class HashCache:
+    """Persistent fingerprint/hash store used to skip transfers of unchanged files"""
+    def __init__(self, local_folder, scope):
+        log_dir = os.path.join(local_folder, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        self._db = shelve.open(os.path.join(log_dir, ".hashcache"))
+        # shelve isn't safe for concurrent access from the transfer workers
+        self._lock = threading.Lock()
+        # Entries only hold for one (host, port, remote folder); syncing the same local
+        # folder to another server or folder must not reuse them
+        self._prefix = "%s:%s:%s|" % scope
+    
+    def get(self, key):
+        with self._lock:
+            return self._db.get(self._prefix + key)
+    
+    def set(self, key, value):
+        with self._lock:
+            self._db[self._prefix + key] = value
+    
+    def discard(self, key):
+        with self._lock:
+            self._db.pop(self._prefix + key, None)
+    
+    def move(self, old_key, new_key):
+        """Re-key an entry in one step, e.g. after the file was renamed on the server"""
+        with self._lock:
+            value = self._db.pop(self._prefix + old_key, None)
+            if value is not None:
+                self._db[self._prefix + new_key] = value
+    
+    def close(self, timeout=-1):
+        """Close the store; with a timeout, give up (leaving it open) if the lock stays busy"""
+        if not self._lock.acquire(timeout=timeout):
             return False
+        try:
+            self._db.close()
+        finally:
+            self._lock.release()
+        return True
 
 class FileMonitor:
     def __init__(self):
+        # Set while stopped; waits on it return as soon as monitoring is stopped
+        self._stop_event = threading.Event()
+        # Set on stop and on remote change notifications, to cut the wait between checks short
+        self._wake = threading.Event()
         self.running = False
         self.last_activity_time = 0
         self.activity_detected = False
+        # Shared worker pool for parallel transfers
+        self._pool = ThreadPoolExecutor(max_workers=TRANSFER_WORKERS)
+        self.hash_cache = None
+        # Held so shutdown() can release them from the signal handler
+        self._client = None
+        self._observer = None
+    
+    @property
+    def running(self):
+        return not self._stop_event.is_set()
+    
+    @running.setter
+    def running(self, value):
+        if value:
+            self._stop_event.clear()
+            self._wake.clear()
+        else:
+            self.stop()
+    
+    def stop(self):
+        """Ask the running monitor loop to finish; any pending wait returns immediately"""
+        self._stop_event.set()
+        self._wake.set()
+    
+    def shutdown(self):
+        """Stop monitoring and release the session, observer and hash cache right away"""
+        self.stop()
+        if self._observer:
+            self._observer.stop()
+        if self._client:
+            self._client.disconnect(quiet=True)
+        if self.hash_cache:
+            # The signal handler may have interrupted this very thread inside a cache
+            # call; the lock would then never come free, so don't wait on it for long
+            self.hash_cache.close(timeout=CACHE_CLOSE_TIMEOUT)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _install_interrupt_handler(self, logger):
+        """Make Ctrl+C exit at once instead of waiting for paramiko/watchdog threads to wind down"""
+        if os.environ.get(NO_HARD_EXIT_ENV) or threading.current_thread() is not threading.main_thread():
+            return
         
-    def calculate_file_hash(self, file_path):
-        """Calculate MD5 hash of a file"""
-        hash_md5 = hashlib.md5()
+        def on_interrupt(signum, frame):
+            # A second Ctrl+C while we're tearing down exits immediately
+            signal.signal(signal.SIGINT, lambda *_: os._exit(0))
+            # Raw write: print() raises if the signal interrupted a write to sys.stdout
+            os.write(_STDOUT_FD, STOPPED_BY_USER_MSG)
+            logger.info("Monitoring stopped by user")
+            self.shutdown()
+            try:
+                sys.stdout.flush()
+            except (RuntimeError, OSError):
+                pass
+            logging.shutdown()
+            os._exit(0)
+        
+        signal.signal(signal.SIGINT, on_interrupt)
+    
+    def wait(self, seconds, status_msg=""):
+        """Wait between checks, returning early on a remote change or True if monitoring was stopped"""
+        # A busy remote file can send change notifications many times a second; only
+        # honour them after WAKE_MIN_GAP so they can't turn polling into a tight loop
+        now = time.monotonic()
+        deadline = now + seconds
+        earliest = now + min(seconds, WAKE_MIN_GAP)
+        if not sys.stdout.isatty():
+            if not self._stop_event.wait(earliest - now):
+                self._wake.wait(max(deadline - time.monotonic(), 0))
+        else:
+            # Interactive: refresh the countdown every few seconds instead of every second
+            while True:
+                now = time.monotonic()
+                remaining = deadline - now
+                if remaining <= 0 or self._stop_event.is_set():
+                    break
+                if now >= earliest:
+                    if self._wake.is_set():
+                        break
+                    event, timeout = self._wake, min(COUNTDOWN_REFRESH, remaining)
+                else:
+                    event, timeout = self._stop_event, min(COUNTDOWN_REFRESH, earliest - now)
+                print(COUNTDOWN_MSG % (math.ceil(remaining), seconds, status_msg), end='\r')
+                event.wait(timeout)
+            
+            print(" " * 80, end='\r')  # Clear line
+        
+        if self._stop_event.is_set():
+            return True
+        self._wake.clear()
+        return False
+    
+    def watch_remote(self, ftp_client, remote_dir, logger):
+        """Wake the REMOTE poll loop on server-side changes via inotifywait, where the server allows it"""
+        if not ftp_client.use_sftp:
+            return
         try:
+            channel = ftp_client.connection.open_session()
+            channel.exec_command(EXEC_WATCH_COMMAND % shlex.quote(remote_dir))
+        except Exception:
+            return  # No shell access; keep polling
+        
+        def read_events():
+            notified = False
+            try:
+                for _ in channel.makefile('rb'):
+                    notified = True
+                    self._wake.set()
+                if not notified and channel.recv_exit_status() != 0:
+                    logger.info("Remote change notifications unavailable (inotifywait); polling only")
+            except Exception:
+                pass
+            finally:
+                channel.close()
+        
+        threading.Thread(target=read_events, daemon=True).start()
+        
+    def calculate_file_hash(self, file_path, algorithm=HASH_ALGORITHM):
+        """Calculate the content hash of a file (BLAKE3 if installed, otherwise SHA-256)"""
+        try:
+            if algorithm == 'blake3':
+                return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(file_path).hexdigest()
+            
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size <= HASH_CHUNK_SIZE:
+                    # Small file: one read, one update
+                    return hashlib.sha256(f.read()).hexdigest()
+                
+                # Large file: hash the mapping in one call, skipping the read() buffer copies
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        return hashlib.sha256(mm).hexdigest()
+                except (OSError, ValueError, OverflowError):
+                    pass  # Can't map it (e.g. too big for a 32-bit process), stream it instead
+                
+                # Let the kernel read ahead since we stream the whole file
+                advise_read(f)
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, "sha256", _bufsize=HASH_CHUNK_SIZE).hexdigest()
+                
+                # Python < 3.11
+                hash_sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    hash_sha256.update(chunk)
+                return hash_sha256.hexdigest()
         except:
             return None
     
+    def find_identical(self, ftp_client, remote_dir, local_sizes, remote_sizes, local_digests=None):
+        """Return the local paths whose remote copy already has the same size and SHA-256"""
+        candidates = [local_path for local_path, size in local_sizes.items()
+                      if remote_sizes.get(os.path.basename(local_path)) == size]
+        if not candidates:
+            return set()
+        
+        # Hash locally while the server hashes its side, skipping files whose SHA-256 is already known
+        local_digests = local_digests or {}
+        local_hashes = {local_path: self._pool.submit(self.calculate_file_hash, local_path, 'sha256')
+                        for local_path in candidates if local_path not in local_digests}
+        remote_hashes = ftp_client.remote_sha256(remote_dir, [os.path.basename(p) for p in candidates])
+        identical = set()
+        for local_path in candidates:
+            digest = local_digests.get(local_path) or local_hashes[local_path].result()
+            if digest and digest == remote_hashes.get(os.path.basename(local_path)):
+                identical.add(local_path)
+        return identical
+    
     def check_for_changes(self, ftp_client, remote_dir, local_dir, file_states, logger):
         """Check for changes and return True if changes were found"""
         changes_found = False
         try:
-            remote_files = ftp_client.list_files(remote_dir)
+            # One listing gives us name, size and mtime for every entry
+            remote_entries = ftp_client.list_attr(remote_dir)
+            if remote_entries is None:
+                return False
             
-            for filename in remote_files:
-                if filename in ['.', '..']:
-                    continue
-                    
-                remote_path = os.path.join(remote_dir, filename).replace('\\', '/')
-                local_path = os.path.join(local_dir, filename)
-                
-                current_size = ftp_client.get_file_size(remote_path)
-                file_exists = ftp_client.file_exists(remote_path)
+            # Build paths by plain concatenation; os.path.join per file adds up on big directories
+            remote_prefix = remote_dir.rstrip('/') + '/'
+            local_prefix = os.path.join(local_dir, '')
+            
+            # Snapshot of the listing: name -> (size, whole-second mtime), so states compare
+            # exactly across polls and protocols
+            current = {filename: (size, int(mtime) if mtime is not None else None)
+                       for filename, size, mtime, is_dir in remote_entries
+                       if not is_dir and filename not in ('.', '..')}
+            added, removed, modified = diff_states(file_states, current)
+            
+            to_download = []
+            for filename in sorted(added):
+                current_state = current[filename]
+                # Already downloaded in a previous run and unchanged on the server
+                if self.hash_cache and os.path.exists(local_prefix + filename):
+                    if self.hash_cache.get('remote:' + filename) == current_state:
+                        file_states[filename] = current_state
+                        continue
                 
-                if filename not in file_states:
-                    # New file detected
-                    print(f"{Colors.BLUE}New file detected: {filename}{Colors.END}")
-                    logger.info(f"NEW FILE DETECTED: {filename}")
-                    if ftp_client.download_file(remote_path, local_path, logger):
-                        file_states[filename] = {
-                            'size': current_size,
-                            'exists': file_exists,
-                            'timestamp': time.time()
-                        }
-                        changes_found = True
-                        self.activity_detected = True
-                        self.last_activity_time = time.time()
-                else:
-                    # Check for changes
-                    previous_state = file_states[filename]
-                    if (previous_state['size'] != current_size or 
-                        previous_state['exists'] != file_exists):
-                        
-                        print(f"{Colors.YELLOW}File changed: {filename}{Colors.END}")
-                        logger.info(f"FILE CHANGED: {filename}")
-                        if ftp_client.download_file(remote_path, local_path, logger):
-                            file_states[filename] = {
-                                'size': current_size,
-                                'exists': file_exists,
-                                'timestamp': time.time()
-                            }
+                # New file detected
+                print(NEW_FILE_MSG % filename)
+                logger.info("NEW FILE DETECTED: %s", filename)
+                to_download.append((filename, current_state))
+            
+            for filename in sorted(modified):
+                print(CHANGED_FILE_MSG % filename)
+                logger.info("FILE CHANGED: %s", filename)
+                to_download.append((filename, current[filename]))
+            
+            # Download all new/changed files in parallel, each worker on its own channel,
+            # sharing one progress bar for the whole batch
+            if to_download:
+                total_size = sum(max(current_state[0] or 0, 0) for _, current_state in to_download)
+                started = time.monotonic()
+                with progress_bar(total_size, DOWNLOADING_DESC) as pbar:
+                    futures = {}
+                    for filename, current_state in to_download:
+                        future = self._pool.submit(ftp_client.download_file, remote_prefix + filename,
+                                                   local_prefix + filename, logger, pbar)
+                        futures[future] = (filename, current_state)
+                    
+                    for future in as_completed(futures):
+                        filename, current_state = futures[future]
+                        if future.result():
+                            file_states[filename] = current_state
+                            if self.hash_cache:
+                                self.hash_cache.set('remote:' + filename, current_state)
                             changes_found = True
                             self.activity_detected = True
                             self.last_activity_time = time.time()
+                
+                # Only pay for the throughput maths when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    elapsed = time.monotonic() - started
+                    logger.debug("Downloaded %d files (%d bytes) in %.2fs, %.1f MB/s", len(to_download),
+                                 total_size, elapsed, total_size / max(elapsed, 1e-6) / 1e6)
             
-            # Check for deleted files
-            for filename in list(file_states.keys()):
-                if filename not in remote_files:
-                    local_path = os.path.join(local_dir, filename)
-                    if os.path.exists(local_path):
-                        os.remove(local_path)
-                        print(f"{Colors.RED}File deleted locally: {filename}{Colors.END}")
-                        logger.info(f"FILE DELETED LOCALLY: {filename}")
-                        changes_found = True
-                        self.activity_detected = True
-                        self.last_activity_time = time.time()
-                    del file_states[filename]
+            # Files that disappeared from the server since the last poll
+            for filename in removed:
+                local_path = local_prefix + filename
+                if os.path.exists(local_path):
+                    os.remove(local_path)
+                    print(DELETED_LOCAL_MSG % filename)
+                    logger.info("FILE DELETED LOCALLY: %s", filename)
+                    changes_found = True
+                    self.activity_detected = True
+                    self.last_activity_time = time.time()
+                del file_states[filename]
+                if self.hash_cache:
+                    self.hash_cache.discard('remote:' + filename)
                     
         except Exception as e:
             print(f"{Colors.RED}Error during change detection: {e}{Colors.END}")
-            logger.error(f"Change detection error: {e}")
+            logger.error("Change detection error: %s", e)
             
         return changes_found
     
     def monitor_remote(self, config, logger):
         """Monitor remote site for changes and download locally"""
         interval = config.get('interval', 60)  # Default to 60 seconds if not specified
-        print(f"\n{Colors.HEADER}{Colors.BOLD}Starting REMOTE monitoring...{Colors.END}")
-        print(f"{Colors.YELLOW}The tool will check for changes on the remote server{Colors.END}")
-        print(f"{Colors.YELLOW}Base interval: {interval} seconds (will check immediately after changes){Colors.END}")
-        print(f"{Colors.YELLOW}Any changes detected will be downloaded to your local folder{Colors.END}")
+        local_dir = config['local_folder']
+        remote_dir = config['remote_folder']
+        sys.stdout.write(REMOTE_START_FMT % interval)
         logger.info("Starting REMOTE monitoring")
-        logger.info(f"Remote folder: {config['remote_folder']}")
-        logger.info(f"Local folder: {config['local_folder']}")
-        logger.info(f"Base check interval: {interval} seconds")
+        self._install_interrupt_handler(logger)
+        logger.info("Remote folder: %s", remote_dir)
+        logger.info("Local folder: %s", local_dir)
+        logger.info("Base check interval: %s seconds", interval)
         
-        ftp_client = FTPClient(
-            config['host'], config['username'], config['password'],
-            config.get('port', 22), config.get('use_sftp', True)
+        use_sftp = config.get('use_sftp', True)
+        ftp_client = get_client(
+            config['host'], config.get('port', _DEFAULT_PORT[use_sftp]), config['username'],
+            config['password'], use_sftp
         )
+        self._client = ftp_client
         
         if not ftp_client.connect():
             print(f"{Colors.RED}Failed to connect to remote server{Colors.END}")
@@ -324,15 +1092,17 @@ class FileMonitor:
             return
         
         # Create local directory if it doesn't exist
-        local_dir = config['local_folder']
         os.makedirs(local_dir, exist_ok=True)
         
-        remote_dir = config['remote_folder']
         file_states = {}
+        self.hash_cache = HashCache(local_dir, (ftp_client.host, ftp_client.port, remote_dir))
         
         # Initial check
         print(f"{Colors.CYAN}Performing initial check for changes...{Colors.END}")
         self.check_for_changes(ftp_client, remote_dir, local_dir, file_states, logger)
+        # Between polls, also check as soon as the server reports a change
+        self.watch_remote(ftp_client, remote_dir, logger)
+        watch_generation = ftp_client.generation
         
         consecutive_no_changes = 0
         current_interval = 5  # Start with quick checks after initial sync
@@ -343,6 +1113,13 @@ class FileMonitor:
                     # Check for changes
                     changes_found = self.check_for_changes(ftp_client, remote_dir, local_dir, file_states, logger)
                     
+                    # The session was re-established behind our back (acquire() reconnects
+                    # lazily): the old notification channel died with it, so start a new one
+                    if ftp_client.generation != watch_generation:
+                        logger.info("Reconnected; restarting remote change notifications")
+                        self.watch_remote(ftp_client, remote_dir, logger)
+                        watch_generation = ftp_client.generation
+                    
                     if changes_found:
                         # Changes detected - check again soon
                         consecutive_no_changes = 0
@@ -363,37 +1140,35 @@ class FileMonitor:
                         else:
                             print(f"{Colors.CYAN}No changes detected ({consecutive_no_changes}x). Next check in {current_interval} seconds...{Colors.END}")
                     
-                    # Wait for the calculated interval
-                    for remaining in range(current_interval, 0, -1):
-                        if not self.running:
-                            break
-                        status_msg = f"Next check in {remaining}s (interval: {current_interval}s)"
-                        if changes_found:
-                            status_msg += " - Changes detected!"
-                        elif consecutive_no_changes > 0:
-                            status_msg += f" - No changes ({consecutive_no_changes}x)"
-                        print(f"{Colors.CYAN}{status_msg}{Colors.END}", end='\r')
-                        time.sleep(1)
-                    
-                    print(" " * 80, end='\r')  # Clear line
+                    # Wait for the calculated interval (returns immediately when stopped)
+                    if changes_found:
+                        status_msg = " - Changes detected!"
+                    else:
+                        status_msg = f" - No changes ({consecutive_no_changes}x)"
+                    if self.wait(current_interval, status_msg):
+                        break
                         
                 except Exception as e:
                     print(f"{Colors.RED}Error during monitoring: {e}{Colors.END}")
-                    logger.error(f"Monitoring error: {e}")
-                    # Try to reconnect
-                    ftp_client.disconnect()
-                    time.sleep(5)
-                    if not ftp_client.connect():
-                        print(f"{Colors.RED}Reconnection failed{Colors.END}")
-                        logger.error("Reconnection failed")
+                    logger.error("Monitoring error: %s", e)
+                    if self._stop_event.wait(5):
                         break
-                    # Reset states after reconnection
-                    file_states = {}
-                    consecutive_no_changes = 0
-                    current_interval = 5
+                    # Only reconnect if the pooled connection actually dropped
+                    if not ftp_client.is_alive():
+                        if not ftp_client.connect():
+                            print(f"{Colors.RED}Reconnection failed{Colors.END}")
+                            logger.error("Reconnection failed")
+                            break
+                        # Reset states after reconnection
+                        file_states = {}
+                        consecutive_no_changes = 0
+                        current_interval = 5
+                        self.watch_remote(ftp_client, remote_dir, logger)
+                        watch_generation = ftp_client.generation
                 
         finally:
             ftp_client.disconnect()
+            self.hash_cache.close()
             logger.info("Remote monitoring stopped")
     
     class LocalChangeHandler(FileSystemEventHandler):
@@ -401,65 +1176,155 @@ class FileMonitor:
             self.ftp_client = ftp_client
             self.remote_dir = remote_dir
             self.local_dir = local_dir
+            self.remote_prefix = remote_dir.rstrip('/') + '/'
             self.logger = logger
             self.monitor_instance = monitor_instance
             self.upload_queue = []
             self.uploading = False
+            # Per-path debounce timers so bursts of events cause a single upload
+            self._pending = {}
+            self._lock = threading.Lock()
         
         def on_created(self, event):
             if not event.is_directory:
-                self.upload_file(event.src_path)
+                self._schedule(event.src_path)
         
         def on_modified(self, event):
             if not event.is_directory:
-                # Small delay to ensure file is completely written
-                threading.Timer(2.0, self.upload_file, [event.src_path]).start()
+                self._schedule(event.src_path)
+        
+        def _schedule(self, local_path):
+            """(Re)start the debounce timer for a path, collapsing repeated events"""
+            with self._lock:
+                timer = self._pending.pop(local_path, None)
+                if timer:
+                    timer.cancel()
+                timer = threading.Timer(DEBOUNCE_DELAY, self._fire, [local_path])
+                self._pending[local_path] = timer
+                timer.start()
+        
+        def _fire(self, local_path):
+            with self._lock:
+                self._pending.pop(local_path, None)
+            
+            # Still being written? Wait for the next quiet window instead
+            try:
+                size = os.path.getsize(local_path)
+                time.sleep(SIZE_SETTLE_DELAY)
+                if os.path.getsize(local_path) != size:
+                    self._schedule(local_path)
+                    return
+            except OSError:
+                return
+            
+            # Upload on the bounded transfer pool so a burst of new files can't open
+            # more SFTP channels than the server allows
+            try:
+                self.monitor_instance._pool.submit(self.upload_file, local_path)
+            except RuntimeError:
+                pass  # Monitor already shut down
         
         def on_deleted(self, event):
             if not event.is_directory:
                 filename = os.path.basename(event.src_path)
-                remote_path = os.path.join(self.remote_dir, filename).replace('\\', '/')
+                remote_path = self.remote_prefix + filename
                 try:
-                    if self.ftp_client.use_sftp:
-                        self.ftp_client.sftp.remove(remote_path)
-                    else:
-                        self.ftp_client.connection.delete(remote_path)
+                    with self.ftp_client.acquire() as conn:
+                        if self.ftp_client.use_sftp:
+                            conn.remove(remote_path)
+                        else:
+                            conn.delete(remote_path)
+                    if self.monitor_instance.hash_cache:
+                        self.monitor_instance.hash_cache.discard('local:' + filename)
                     print(f"{Colors.RED}File deleted remotely: {filename}{Colors.END}")
-                    self.logger.info(f"FILE DELETED REMOTELY: {filename}")
+                    self.logger.info("FILE DELETED REMOTELY: %s", filename)
                     self.monitor_instance.activity_detected = True
                     self.monitor_instance.last_activity_time = time.time()
                 except Exception as e:
                     print(f"{Colors.RED}Error deleting remote file: {e}{Colors.END}")
-                    self.logger.error(f"DELETE FAILED: {filename} - {e}")
+                    self.logger.error("DELETE FAILED: %s - %s", filename, e)
         
         def on_moved(self, event):
             # Handle file renames/moves
             if not event.is_directory:
+                # Changed and renamed before its upload went out (e.g. an editor saving via
+                # tmpfile + rename): coalesce the burst into a single upload of the final name
+                with self._lock:
+                    timer = self._pending.pop(event.src_path, None)
+                if timer:
+                    timer.cancel()
+                    self._schedule(event.dest_path)
+                    # A debounce only means the latest change wasn't sent; if an earlier
+                    # version is on the server under the old name, remove it
+                    hash_cache = self.monitor_instance.hash_cache
+                    if hash_cache and hash_cache.get('local:' + os.path.basename(event.src_path)):
+                        self.on_deleted(FileDeletedEvent(event.src_path))
+                    return
+
                 old_filename = os.path.basename(event.src_path)
                 new_filename = os.path.basename(event.dest_path)
-                old_remote_path = os.path.join(self.remote_dir, old_filename).replace('\\', '/')
-                new_remote_path = os.path.join(self.remote_dir, new_filename).replace('\\', '/')
+                old_remote_path = self.remote_prefix + old_filename
+                new_remote_path = self.remote_prefix + new_filename
                 
                 try:
-                    if self.ftp_client.use_sftp:
-                        self.ftp_client.sftp.rename(old_remote_path, new_remote_path)
-                    else:
-                        # FTP doesn't have a direct rename command, so we need to download and re-upload
-                        temp_path = os.path.join(self.local_dir, f"temp_{old_filename}")
-                        with open(temp_path, 'wb') as f:
-                            self.ftp_client.connection.retrbinary(f'RETR {old_remote_path}', f.write)
-                        self.ftp_client.connection.delete(old_remote_path)
-                        with open(temp_path, 'rb') as f:
-                            self.ftp_client.connection.storbinary(f'STOR {new_remote_path}', f)
-                        os.remove(temp_path)
+                    with self.ftp_client.acquire() as conn:
+                        if self.ftp_client.use_sftp:
+                            conn.rename(old_remote_path, new_remote_path)
+                        else:
+                            # FTP doesn't have a direct rename command, so we need to download and re-upload
+                            temp_path = os.path.join(self.local_dir, f"temp_{old_filename}")
+                            with open(temp_path, 'wb') as f:
+                                conn.retrbinary(f'RETR {old_remote_path}', f.write)
+                            conn.delete(old_remote_path)
+                            with open(temp_path, 'rb') as f:
+                                conn.storbinary(f'STOR {new_remote_path}', f)
+                            os.remove(temp_path)
                     
+                    # Same content under the new name: carry its fingerprint over so the
+                    # next start doesn't upload it again
+                    if self.monitor_instance.hash_cache:
+                        self.monitor_instance.hash_cache.move('local:' + old_filename, 'local:' + new_filename)
                     print(f"{Colors.YELLOW}File renamed remotely: {old_filename} -> {new_filename}{Colors.END}")
-                    self.logger.info(f"FILE RENAMED: {old_filename} -> {new_filename}")
+                    self.logger.info("FILE RENAMED: %s -> %s", old_filename, new_filename)
                     self.monitor_instance.activity_detected = True
                     self.monitor_instance.last_activity_time = time.time()
                 except Exception as e:
                     print(f"{Colors.RED}Error renaming remote file: {e}{Colors.END}")
-                    self.logger.error(f"RENAME FAILED: {old_filename} -> {new_filename} - {e}")
+                    self.logger.error("RENAME FAILED: %s -> %s - %s", old_filename, new_filename, e)
+        
+        def check_changed(self, local_path, st=None):
+            """Return the cache entry to record after uploading, or None if the file is unchanged since its last upload"""
+            hash_cache = self.monitor_instance.hash_cache
+            if not hash_cache:
+                return ()
+            
+            filename = os.path.basename(local_path)
+            if st is None:
+                try:
+                    st = os.stat(local_path)
+                except OSError:
+                    return None  # Gone before we got to it
+            fingerprint = (st.st_size, st.st_mtime_ns)
+            cached = hash_cache.get('local:' + filename)
+            # Same size and mtime as the last upload: nothing to do
+            if cached and cached[:2] == fingerprint:
+                return None
+            
+            # Metadata changed but content didn't (e.g. touch): just refresh the entry
+            file_hash = self.monitor_instance.calculate_file_hash(local_path)
+            entry = fingerprint + (HASH_ALGORITHM, file_hash)
+            if cached and file_hash and cached[2:] == entry[2:]:
+                hash_cache.set('local:' + filename, entry)
+                return None
+            return entry
+        
+        def record_upload(self, local_path, entry):
+            """Remember a successful upload so unchanged files are skipped next time"""
+            hash_cache = self.monitor_instance.hash_cache
+            if hash_cache and entry:
+                hash_cache.set('local:' + os.path.basename(local_path), entry)
+            self.monitor_instance.activity_detected = True
+            self.monitor_instance.last_activity_time = time.time()
         
         def upload_file(self, local_path):
             """Upload file with retry logic"""
@@ -467,96 +1332,190 @@ class FileMonitor:
                 return
                 
             filename = os.path.basename(local_path)
-            remote_path = os.path.join(self.remote_dir, filename).replace('\\', '/')
+            remote_path = self.remote_prefix + filename
             
             try:
-                # Wait a moment to ensure file is completely written
-                time.sleep(1)
+                entry = self.check_changed(local_path)
+                if entry is None:
+                    return
                 
                 if self.ftp_client.upload_file(local_path, remote_path, self.logger):
-                    self.monitor_instance.activity_detected = True
-                    self.monitor_instance.last_activity_time = time.time()
+                    self.record_upload(local_path, entry)
             except Exception as e:
                 print(f"{Colors.RED}Error uploading file: {e}{Colors.END}")
-                self.logger.error(f"UPLOAD FAILED: {filename} - {e}")
+                self.logger.error("UPLOAD FAILED: %s - %s", filename, e)
+    
+    def initial_sync(self, ftp_client, event_handler, local_dir, remote_dir, logger):
+        """Upload every local file the server doesn't already hold before watching for changes"""
+        # A single directory read gives us names, types and sizes without a stat per entry
+        with os.scandir(local_dir) as it:
+            local_stats = {entry.path: entry.stat() for entry in it if entry.is_file()}
+        local_files = {local_path: st.st_size for local_path, st in local_stats.items()}
+        if local_files:
+            print(f"{Colors.CYAN}Performing initial sync of {len(local_files)} files...{Colors.END}")
+            logger.info("Performing initial sync of %s files", len(local_files))
+            
+            # What the server holds now; the cache only says what we uploaded before
+            remote_entries = ftp_client.list_attr(remote_dir) or []
+            remote_sizes = {name: size for name, size, _, is_dir in remote_entries if not is_dir}
+            
+            # Fingerprint/hash the candidates in parallel and drop the unchanged ones,
+            # reusing the stat results from the directory scan
+            local_paths = list(local_stats)
+            entries = {}
+            for local_path, entry in zip(local_paths, self._pool.map(event_handler.check_changed, local_paths,
+                                                                     local_stats.values())):
+                if entry is None:
+                    # Unchanged since its last upload, but only skip it if the server still has it
+                    filename = os.path.basename(local_path)
+                    if remote_sizes.get(filename) == local_files[local_path]:
+                        continue
+                    entry = self.hash_cache.get('local:' + filename) or ()
+                entries[local_path] = entry
+            
+            # Same size and checksum on the server already (e.g. first run against a
+            # populated folder): just remember them instead of uploading again
+            if entries:
+                # check_changed has just hashed these; with SHA-256 as the cache algorithm
+                # those digests compare directly against sha256sum's
+                sha256_digests = {local_path: entry[3] for local_path, entry in entries.items()
+                                  if len(entry) == 4 and entry[2] == 'sha256' and entry[3]}
+                identical = self.find_identical(ftp_client, remote_dir,
+                                                {local_path: local_files[local_path] for local_path in entries},
+                                                remote_sizes, sha256_digests)
+                for local_path in identical:
+                    entry = entries.pop(local_path)
+                    if entry:
+                        self.hash_cache.set('local:' + os.path.basename(local_path), entry)
+                if identical:
+                    print(f"{Colors.GREEN}✓ {len(identical)} files already up to date on the server{Colors.END}")
+                    logger.info("Skipped %d files already identical on the server", len(identical))
+            
+            if entries:
+                pending = [(local_path, event_handler.remote_prefix + os.path.basename(local_path))
+                           for local_path in entries]
+                total_size = sum(local_files[local_path] for local_path in entries)
+                
+                # Spread the files over the workers; each batch streams over a single channel
+                started = time.monotonic()
+                with progress_bar(total_size, f"{Colors.CYAN}Initial Upload{Colors.END}") as pbar:
+                    batches = [pending[i::TRANSFER_WORKERS] for i in range(TRANSFER_WORKERS)]
+                    futures = [self._pool.submit(ftp_client.upload_many, batch, logger, pbar)
+                               for batch in batches if batch]
+                    for future in as_completed(futures):
+                        try:
+                            uploaded = future.result()
+                        except Exception as e:
+                            print(f"{Colors.RED}✗ Upload batch failed: {e}{Colors.END}")
+                            logger.error("UPLOAD BATCH FAILED: %s", e)
+                            continue
+                        for local_path in uploaded:
+                            event_handler.record_upload(local_path, entries[local_path])
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    elapsed = time.monotonic() - started
+                    logger.debug("Initial upload of %d files (%d bytes) took %.2fs, %.1f MB/s", len(pending),
+                                 total_size, elapsed, total_size / max(elapsed, 1e-6) / 1e6)
     
     def monitor_local(self, config, logger):
         """Monitor local folder for changes and upload to remote"""
         interval = config.get('interval', 60)
-        print(f"\n{Colors.HEADER}{Colors.BOLD}Starting LOCAL monitoring...{Colors.END}")
-        print(f"{Colors.YELLOW}The tool will watch for changes in your local folder{Colors.END}")
-        print(f"{Colors.YELLOW}Base interval: {interval} seconds for periodic checks{Colors.END}")
-        print(f"{Colors.YELLOW}Any changes detected will be uploaded to the remote server{Colors.END}")
+        local_dir = config['local_folder']
+        remote_dir = config['remote_folder']
+        sys.stdout.write(LOCAL_START_FMT % interval)
         logger.info("Starting LOCAL monitoring")
-        logger.info(f"Remote folder: {config['remote_folder']}")
-        logger.info(f"Local folder: {config['local_folder']}")
-        logger.info(f"Base check interval: {interval} seconds")
+        self._install_interrupt_handler(logger)
+        logger.info("Remote folder: %s", remote_dir)
+        logger.info("Local folder: %s", local_dir)
+        logger.info("Base check interval: %s seconds", interval)
         
-        ftp_client = FTPClient(
-            config['host'], config['username'], config['password'],
-            config.get('port', 22), config.get('use_sftp', True)
+        use_sftp = config.get('use_sftp', True)
+        ftp_client = get_client(
+            config['host'], config.get('port', _DEFAULT_PORT[use_sftp]), config['username'],
+            config['password'], use_sftp
         )
+        self._client = ftp_client
         
         if not ftp_client.connect():
             print(f"{Colors.RED}Failed to connect to remote server{Colors.END}")
             logger.error("Failed to connect to remote server")
             return
         
-        local_dir = config['local_folder']
-        remote_dir = config['remote_folder']
-        
-        # Initial sync: upload all local files with progress
-        local_files = [f for f in os.listdir(local_dir) if os.path.isfile(os.path.join(local_dir, f))]
-        if local_files:
-            print(f"{Colors.CYAN}Performing initial sync of {len(local_files)} files...{Colors.END}")
-            logger.info(f"Performing initial sync of {len(local_files)} files")
-            
-            for filename in tqdm(local_files, desc=f"{Colors.CYAN}Initial Upload{Colors.END}", 
-                                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"):
-                local_path = os.path.join(local_dir, filename)
-                remote_path = os.path.join(remote_dir, filename).replace('\\', '/')
-                ftp_client.upload_file(local_path, remote_path, logger)
-                self.activity_detected = True
-                self.last_activity_time = time.time()
-        
-        # Set up watchdog observer
+        self.hash_cache = HashCache(local_dir, (ftp_client.host, ftp_client.port, remote_dir))
         event_handler = self.LocalChangeHandler(ftp_client, remote_dir, local_dir, logger, self)
-        observer = Observer()
-        observer.schedule(event_handler, local_dir, recursive=False)
-        observer.start()
-        
-        print(f"{Colors.GREEN}✓ Now monitoring local folder for changes{Colors.END}")
-        print(f"{Colors.YELLOW}Press Ctrl+C to stop monitoring{Colors.END}")
-        logger.info("Now monitoring local folder for changes")
-        
-        # Additional periodic check for any missed changes
-        last_periodic_check = time.time()
         
+        observer = None
         try:
-            while self.running:
+            # Initial sync: upload all local files with progress, skipping unchanged ones.
+            # A failure here still leaves us watching for changes
+            try:
+                self.initial_sync(ftp_client, event_handler, local_dir, remote_dir, logger)
+            except Exception as e:
+                print(f"{Colors.RED}Initial sync failed: {e}{Colors.END}")
+                logger.error("Initial sync failed: %s", e)
+            
+            # Set up watchdog observer (inotify / FSEvents / ReadDirectoryChangesW)
+            from watchdog.observers import Observer
+            observer = Observer()
+            self._observer = observer
+            try:
+                # Only subscribe to the events we act on, so the backend doesn't report
+                # open/close noise (including our own reads while uploading)
+                observer.schedule(event_handler, local_dir, recursive=False,
+                                  event_filter=[FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent])
+            except TypeError:
+                # watchdog < 4.0 has no event_filter
+                observer.schedule(event_handler, local_dir, recursive=False)
+            observer.start()
+            
+            print(f"{Colors.GREEN}✓ Now monitoring local folder for changes{Colors.END}")
+            print(f"{Colors.YELLOW}Press Ctrl+C to stop monitoring{Colors.END}")
+            logger.info("Now monitoring local folder for changes")
+            
+            # Sleep on the stop event between periodic checks, so stopping wakes us immediately
+            while not self._stop_event.wait(interval):
                 # Periodic check every interval seconds for any missed changes
-                current_time = time.time()
-                if current_time - last_periodic_check >= interval:
-                    print(f"{Colors.CYAN}Performing periodic check for missed changes...{Colors.END}")
-                    # Here you could add logic to check for any inconsistencies
-                    last_periodic_check = current_time
-                
-                time.sleep(1)
+                print(f"{Colors.CYAN}Performing periodic check for missed changes...{Colors.END}")
+                # Here you could add logic to check for any inconsistencies
         except KeyboardInterrupt:
-            observer.stop()
+            pass
         finally:
-            observer.stop()
-            observer.join()
+            if observer and observer.is_alive():
+                observer.stop()
+                observer.join()
             ftp_client.disconnect()
+            self.hash_cache.close()
             logger.info("Local monitoring stopped")
 
+# Runs in a child interpreter so this process never has to load Tk for the folder picker
+LOCAL_FOLDER_DIALOG = """
+import tkinter as tk
+from tkinter import filedialog
+root = tk.Tk()
+root.withdraw()  # Hide the main window
+root.attributes('-topmost', True)
+print(filedialog.askdirectory(title="Select Local Folder to Monitor"))
+root.destroy()
+"""
+
+def has_display():
+    """Whether a Tk window can be shown; X11/Wayland sessions advertise one in the environment"""
+    return (sys.platform in ('win32', 'darwin') or
+            bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')))
+
 def browse_local_folder():
     """Open a dialog to select local folder"""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    root.attributes('-topmost', True)
-    folder_path = filedialog.askdirectory(title="Select Local Folder to Monitor")
-    root.destroy()
+    # Headless (e.g. over SSH): ask on the console instead of starting Tk
+    if not has_display():
+        folder_path = input(f"{Colors.CYAN}Local folder: {Colors.END}").strip()
+        return os.path.normpath(folder_path) if folder_path else folder_path
+    result = subprocess.run([sys.executable, '-c', LOCAL_FOLDER_DIALOG], capture_output=True,
+                            encoding='utf-8', env=dict(os.environ, PYTHONIOENCODING='utf-8'))
+    if result.returncode != 0:
+        # e.g. tkinter missing or no usable display; say why instead of just "nothing selected"
+        print(f"{Colors.RED}Folder dialog failed: {result.stderr.strip()}{Colors.END}")
+        return ""
+    folder_path = result.stdout.strip()
     
     if folder_path:
         # Normalize path for Windows
@@ -567,6 +1526,16 @@ def browse_local_folder():
 
 def select_remote_folder(ftp_client):
     """Open a dialog to select remote folder"""
+    if not has_display():
+        # Headless: list the top-level folders and ask for a path on the console
+        folders = ftp_client.list_folders("/")
+        sys.stdout.write("".join(f"{Colors.YELLOW}  /{name}{Colors.END}\n" for name in folders))
+        return input(f"{Colors.CYAN}Remote folder (default /): {Colors.END}").strip() or "/"
+    
+    # Imported here so runs that never open the browser don't pay for loading Tk
+    import tkinter as tk
+    from tkinter import Listbox, Scrollbar, ttk
+    
     root = tk.Tk()
     root.title("Select Remote Folder")
     root.geometry("600x500")
@@ -654,118 +1623,169 @@ def select_remote_folder(ftp_client):
     
     return getattr(root, 'selected_path', None)
 
+@contextmanager
+def _raw_mode(fd):
+    """Put the terminal on fd into raw mode, restoring it right away on exit"""
+    old_settings = termios.tcgetattr(fd)
+    tty.setraw(fd)
+    try:
+        yield fd
+    finally:
+        # TCSANOW: nothing useful is queued for output, so don't wait for a drain
+        termios.tcsetattr(fd, termios.TCSANOW, old_settings)
+
 def get_password_with_stars(prompt="Password: "):
-    """Get password input with * symbols instead of blank"""
+    """Get password input, with * symbols instead of blank when MASK_ENV asks for them"""
+    # getpass does the no-echo terminal handling natively; the starred loop is opt-in
+    if os.environ.get(MASK_ENV) != 'stars' or not sys.stdin.isatty():
+        return getpass.getpass(prompt)
     if sys.platform == "win32":
         # Windows doesn't support getpass with custom prompt characters easily
         # So we'll use a simple approach for Windows
         import msvcrt
-        print(prompt, end='', flush=True)
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        write, flush = sys.stdout.buffer.write, sys.stdout.buffer.flush
         password = []
         while True:
-            ch = msvcrt.getch()
-            if ch in [b'\r', b'\n']:  # Enter key
-                print()
+            # getwch reads a full Unicode character, so non-ASCII passwords don't depend on the code page
+            ch = msvcrt.getwch()
+            if ch in ('\r', '\n'):  # Enter key
+                write(b'\n')
                 break
-            elif ch == b'\x08':  # Backspace
+            elif ch == '\x08':  # Backspace
                 if password:
                     password.pop()
-                    print('\b \b', end='', flush=True)
+                    write(_BS)
+            elif ch == '\x03':  # Ctrl+C
+                raise KeyboardInterrupt
+            elif ch in ('\x00', '\xe0'):  # Arrow/function key: skip its second code
+                msvcrt.getwch()
+                continue
             else:
-                password.append(ch.decode('utf-8'))
-                print('*', end='', flush=True)
+                password.append(ch)
+                write(_STAR)
+            flush()
+        flush()
         return ''.join(password)
     else:
         # For Unix/Linux/Mac, we can use a more sophisticated approach
-        import termios
-        import tty
+        import select
         
         print(prompt, end='', flush=True)
-        password = []
+        password = bytearray()
         fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
+        # An inherited non-blocking stdout would make os.write raise BlockingIOError mid-echo
+        os.set_blocking(_STDOUT_FD, True)
+        with _raw_mode(fd):
             while True:
-                ch = sys.stdin.read(1)
-                if ch in ['\r', '\n']:  # Enter key
-                    print()
+                # Read raw bytes straight from the fd so a paste is handled in one pass
+                select.select([fd], [], [])
+                buf = os.read(fd, 256)
+                if not buf:  # EOF
                     break
-                elif ch == '\x7f':  # Backspace
-                    if password:
-                        password.pop()
-                        print('\b \b', end='', flush=True)
-                elif ch == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt
-                else:
-                    password.append(ch)
-                    print('*', end='', flush=True)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ''.join(password)
+                # Collect the echo for the whole burst and write it in one call
+                echo = bytearray()
+                for b in buf:
+                    if b in (0x0d, 0x0a):  # Enter key
+                        os.write(_STDOUT_FD, echo + _CRLF)
+                        return password.decode('utf-8', 'replace')
+                    elif b == 0x7f:  # Backspace
+                        if password:
+                            # Drop a whole UTF-8 character, not just its last byte
+                            while password and 0x80 <= password[-1] < 0xc0:
+                                password.pop()
+                            if password:
+                                password.pop()
+                            echo += _BS
+                    elif b == 0x03:  # Ctrl+C
+                        os.write(_STDOUT_FD, echo)
+                        raise KeyboardInterrupt
+                    else:
+                        password.append(b)
+                        if not 0x80 <= b < 0xc0:  # One star per character
+                            echo += _STAR
+                if echo:
+                    os.write(_STDOUT_FD, echo)
+        return password.decode('utf-8', 'replace')
+
+def resolve_host(host, port):
+    """Look host up within DNS_TIMEOUT; return None if it resolves, else the reason it didn't"""
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        pool.submit(socket.getaddrinfo, host, port, type=socket.SOCK_STREAM).result(timeout=DNS_TIMEOUT)
+        return None
+    except FutureTimeout:
+        return "no DNS answer within %ss" % DNS_TIMEOUT
+    except (socket.gaierror, UnicodeError) as e:
+        return str(e)
+    finally:
+        # Don't wait on a lookup that is still hanging
+        pool.shutdown(wait=False)
+
+def _validate(field, raw):
+    """Parse raw input against the rule for field; print why and return None if it doesn't fit"""
+    parse, check, expected = _RULES[field]
+    try:
+        value = parse(raw)
+    except ValueError:
+        value = None
+    if value is None or not check(value):
+        print(_INVALID_FIELD % (field, raw, expected))
+        return None
+    return value
+
+def check_config(config):
+    """Check every field of config against _CONFIG_SCHEMA; return one message per problem"""
+    problems = []
+    for field, (check, expected) in _CONFIG_SCHEMA.items():
+        value = config.get(field)
+        if not check(value):
+            problems.append(_INVALID_FIELD % (field, value, expected))
+    return problems
 
 def get_monitoring_interval():
     """Get monitoring interval from user with predefined options"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}Monitoring Interval Selection{Colors.END}")
-    print(f"{Colors.YELLOW}Please choose a monitoring interval:{Colors.END}")
-    print(f"{Colors.CYAN}1. 1 minute (frequent checks){Colors.END}")
-    print(f"{Colors.CYAN}2. 5 minutes (balanced){Colors.END}")
-    print(f"{Colors.CYAN}3. 20 minutes (less frequent){Colors.END}")
-    print(f"{Colors.CYAN}4. 60 minutes (infrequent){Colors.END}")
-    print(f"{Colors.CYAN}5. Custom interval{Colors.END}")
+    sys.stdout.write(_INTERVAL_MENU)
+    sys.stdout.flush()
     
     while True:
-        choice = input(f"\n{Colors.CYAN}Enter your choice (1-5): {Colors.END}").strip()
-        
-        if choice == '1':
-            return 60  # 1 minute in seconds
-        elif choice == '2':
-            return 300  # 5 minutes in seconds
-        elif choice == '3':
-            return 1200  # 20 minutes in seconds
-        elif choice == '4':
-            return 3600  # 60 minutes in seconds
+        choice = input(_PROMPT_CHOICE_1_5).strip()
+        
+        interval = _INTERVAL_MAP.get(choice)
+        if interval is not None:
+            return interval
         elif choice == '5':
             return get_custom_interval()
         else:
-            print(f"{Colors.RED}Invalid choice. Please enter 1-5.{Colors.END}")
+            print(_INVALID_1_5)
 
 def get_custom_interval():
     """Get custom interval from user"""
-    print(f"\n{Colors.HEADER}Custom Interval Selection{Colors.END}")
-    print(f"{Colors.YELLOW}Choose time unit:{Colors.END}")
-    print(f"{Colors.CYAN}1. Seconds{Colors.END}")
-    print(f"{Colors.CYAN}2. Minutes{Colors.END}")
-    print(f"{Colors.CYAN}3. Hours{Colors.END}")
+    sys.stdout.write(_CUSTOM_MENU)
+    sys.stdout.flush()
     
     while True:
-        unit_choice = input(f"{Colors.CYAN}Enter your choice (1-3): {Colors.END}").strip()
+        unit_choice = input(_PROMPT_CHOICE_1_3).strip()
         
-        if unit_choice in ['1', '2', '3']:
+        if unit_choice in _UNIT_MULT:
             break
         else:
-            print(f"{Colors.RED}Invalid choice. Please enter 1-3.{Colors.END}")
+            print(_INVALID_1_3)
     
     # Get the interval value
     while True:
-        try:
-            value = input(f"{Colors.CYAN}Enter the interval value: {Colors.END}").strip()
-            interval_value = float(value)
-            
-            if interval_value <= 0:
-                print(f"{Colors.RED}Interval must be greater than 0.{Colors.END}")
-                continue
-                
-            # Convert to seconds based on unit
-            if unit_choice == '1':  # Seconds
-                return int(interval_value)
-            elif unit_choice == '2':  # Minutes
-                return int(interval_value * 60)
-            elif unit_choice == '3':  # Hours
-                return int(interval_value * 3600)
-                
-        except ValueError:
-            print(f"{Colors.RED}Please enter a valid number.{Colors.END}")
+        raw = input(_PROMPT_INTERVAL_VALUE).strip()
+        interval_value = _validate('interval', raw)
+        if interval_value is None:
+            continue
+        # Convert to seconds based on unit
+        # At least one second, so a tiny fraction doesn't become a zero interval
+        seconds = max(1, int(interval_value * _UNIT_MULT[unit_choice]))
+        # Event.wait() overflows beyond TIMEOUT_MAX
+        if seconds <= threading.TIMEOUT_MAX:
+            return seconds
+        print(_INVALID_FIELD % ('interval', raw, "at most %d seconds" % threading.TIMEOUT_MAX))
 
 def get_user_input():
     """Get configuration from user"""
@@ -777,39 +1797,50 @@ def get_user_input():
     protocol = input(f"{Colors.CYAN}Use SFTP? (y/n, default y): {Colors.END}").lower().strip()
     config['use_sftp'] = not protocol.startswith('n') if protocol else True
     
-    # Server details
-    config['host'] = input(f"{Colors.CYAN}Server host: {Colors.END}").strip()
-    default_port = 22 if config['use_sftp'] else 21
-    port_input = input(f"{Colors.CYAN}Port (default {default_port}): {Colors.END}").strip()
-    config['port'] = int(port_input) if port_input else default_port
+    # Server details; look the host up now so a typo is caught before the password is asked for
+    default_port = _DEFAULT_PORT[config['use_sftp']]
+    port_prompt = f"{Colors.CYAN}Port (default {default_port}): {Colors.END}"
+    while True:
+        config['host'] = input(f"{Colors.CYAN}Server host: {Colors.END}").strip()
+        # Re-ask only for the port on a typo instead of failing the whole setup
+        config['port'] = None
+        while config['port'] is None:
+            port_input = input(port_prompt).strip()
+            config['port'] = _validate('port', port_input) if port_input else default_port
+        error = resolve_host(config['host'], config['port'])
+        if error is None:
+            break
+        print(_INVALID_FIELD % ('host', config['host'], "a resolvable host name or address (%s)" % error))
     config['username'] = input(f"{Colors.CYAN}Username: {Colors.END}").strip()
     
-    # Get password with * masking
+    # Get password (silent by default, * masking when SFTPMON_MASK=stars)
     config['password'] = get_password_with_stars(f"{Colors.CYAN}Password: {Colors.END}")
     
     # Get monitoring interval
     config['interval'] = get_monitoring_interval()
     
     # Validate credentials and get remote folder
-    ftp_client = FTPClient(
-        config['host'], config['username'], config['password'],
-        config['port'], config['use_sftp']
+    ftp_client = get_client(
+        config['host'], config['port'], config['username'],
+        config['password'], config['use_sftp']
     )
     
     if not ftp_client.connect():
         print(f"{Colors.RED}Failed to connect with provided credentials. Please check your settings.{Colors.END}")
         sys.exit(1)
     
+    # Close the session however the run ends; the monitor reuses it until then
+    atexit.register(ftp_client.disconnect, quiet=True)
     print(f"{Colors.GREEN}Connected successfully! Please select a remote folder...{Colors.END}")
+    # Leave the connection open; the monitor picks it up again via get_client()
     config['remote_folder'] = select_remote_folder(ftp_client)
-    ftp_client.disconnect()
     
     if not config['remote_folder']:
         print(f"{Colors.RED}No remote folder selected. Exiting.{Colors.END}")
         sys.exit(1)
     
     # Normalize remote path
-    config['remote_folder'] = config['remote_folder'].replace('\\', '/')
+    config['remote_folder'] = config['remote_folder'].translate(_BACKSLASH_TO_SLASH)
     print(f"{Colors.GREEN}Selected remote folder: {config['remote_folder']}{Colors.END}")
     
     # Get local folder
@@ -825,7 +1856,7 @@ def get_user_input():
     print(f"{Colors.YELLOW}1. REMOTE monitoring: Watch the remote server for changes and download them locally{Colors.END}")
     print(f"{Colors.YELLOW}2. LOCAL monitoring: Watch your local folder for changes and upload them to the server{Colors.END}")
 
-    direction = input(f"\n{Colors.CYAN}Enter 'remote' or 'local' to choose monitoring direction: {Colors.END}").lower().strip()
+    direction = input(f"\n{Colors.CYAN}Enter 'remote' or 'local' to choose monitoring direction: {Colors.END}").strip().lower()
 
     # Default to REMOTE monitoring if no input
     if not direction:
@@ -833,4 +1864,12 @@ def get_user_input():
         config['monitor_remote'] = True
     else:
         # Set based on user input - 'remote' or anything starting with 'r' = True, else False
-        config['monitor_remote'] = direction
+        config['monitor_remote'] = direction.startswith('r')
+
+    problems = check_config(config)
+    if problems:
+        print("\n".join(problems))
+        sys.exit(1)
+
+    # Hand back the live client too, so callers don't repeat the handshake
+    return config, ftp_client